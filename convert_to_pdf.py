@@ -7,11 +7,404 @@ Supports multiple conversion methods with optimized settings for print quality.
 import os
 import sys
 import time
+import atexit
+import base64
+import importlib.util
+import io
+import json
+import multiprocessing
+import queue
+import shutil
+import socket
+import socketserver
+import stat
+import hashlib
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from urllib.parse import unquote, urlparse
+from typing import Optional, Dict, Any, Callable, List, Tuple
 import argparse
 
 
+class _BrowserSlot:
+    """A pool slot: one browser plus the dedicated thread that drives it"""
+
+    def __init__(self):
+        self.browser = None
+        self.uses = 0
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def call(self, fn: Callable, *args) -> Any:
+        """Run fn(*args) on this slot's thread and return its result"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+        future: Future = Future()
+        self._jobs.put((future, fn, args))
+        return future.result()
+
+    def stop(self):
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _worker(self):
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                return
+            future, fn, args = item
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+class BrowserPool:
+    """
+    Thread-safe pool of long-lived headless browsers
+    
+    Browsers are launched on first use and then reused across conversions,
+    so only the first call pays the Chromium cold start. Each slot is driven
+    from its own thread because Playwright's sync API is thread-affine.
+    
+    Args:
+        launch: Callable returning a new browser handle
+        close: Callable shutting down a browser handle
+        size: Number of browsers (default: $BROWSER_POOL_SIZE or 4)
+        recycle_after: Relaunch a browser after this many jobs
+            (default: $BROWSER_POOL_RECYCLE_AFTER or 100)
+    """
+
+    def __init__(
+        self,
+        launch: Callable[[], Any],
+        close: Callable[[Any], None],
+        size: Optional[int] = None,
+        recycle_after: Optional[int] = None
+    ):
+        self.launch = launch
+        self.close_browser = close
+        if size is None:
+            size = int(os.environ.get('BROWSER_POOL_SIZE', 4))
+        if recycle_after is None:
+            recycle_after = int(os.environ.get('BROWSER_POOL_RECYCLE_AFTER', 100))
+        if size < 1:
+            raise ValueError(f"Browser pool size must be at least 1, got {size}")
+        if recycle_after < 1:
+            raise ValueError(
+                f"Browser pool recycle_after must be at least 1, got {recycle_after}"
+            )
+        self.size = size
+        self.recycle_after = recycle_after
+        self._slots: queue.Queue = queue.Queue()
+        self._all = [_BrowserSlot() for _ in range(self.size)]
+        for slot in self._all:
+            self._slots.put(slot)
+
+    def acquire(self) -> _BrowserSlot:
+        """Block until a slot is free and return it"""
+        return self._slots.get()
+
+    def release(self, slot: _BrowserSlot):
+        """Return a slot obtained from acquire() to the pool"""
+        self._slots.put(slot)
+
+    def run(self, job: Callable[[Any], Any]) -> Any:
+        """Run job(browser) on a pooled browser and return its result"""
+        slot = self.acquire()
+        try:
+            return slot.call(self._run_job, slot, job)
+        finally:
+            self.release(slot)
+
+    def close(self):
+        """
+        Shut down every idle browser and its slot thread
+        
+        Slots still running a job (e.g. the losing side of an auto-mode race)
+        are left alone rather than blocking shutdown on them.
+        """
+        while True:
+            try:
+                slot = self._slots.get_nowait()
+            except queue.Empty:
+                return
+            if slot.browser is not None:
+                slot.call(self._retire, slot)
+            slot.stop()
+
+    def _run_job(self, slot: _BrowserSlot, job: Callable[[Any], Any]) -> Any:
+        if slot.browser is None:
+            slot.browser = self.launch()
+            slot.uses = 0
+        try:
+            result = job(slot.browser)
+        except ConversionCancelled:
+            # A job that stopped between steps leaves its browser usable
+            raise
+        except Exception:
+            # The browser may have crashed; start clean on the next job
+            self._retire(slot)
+            raise
+        slot.uses += 1
+        if slot.uses >= self.recycle_after:
+            self._retire(slot)
+        return result
+
+    def _retire(self, slot: _BrowserSlot):
+        browser, slot.browser = slot.browser, None
+        try:
+            self.close_browser(browser)
+        except Exception:
+            pass
+
+
+_browser_pools: Dict[str, BrowserPool] = {}
+_browser_pools_lock = threading.Lock()
+
+
+def get_browser_pool(
+    name: str,
+    launch: Callable[[], Any],
+    close: Callable[[Any], None]
+) -> BrowserPool:
+    """Return the process-wide browser pool for a backend, creating it once"""
+    with _browser_pools_lock:
+        if name not in _browser_pools:
+            if not _browser_pools:
+                atexit.register(close_browser_pools)
+            _browser_pools[name] = BrowserPool(launch, close)
+        return _browser_pools[name]
+
+
+def close_browser_pools():
+    """Shut down all browser pools (registered with atexit)"""
+    with _browser_pools_lock:
+        pools = list(_browser_pools.values())
+        _browser_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class ConversionCancelled(Exception):
+    """Raised inside a converter whose auto-mode race was already won"""
+
+
+class _CancelToken:
+    """
+    Cancellation signal for one auto-mode attempt
+    
+    Converters register abort callbacks (quit the driver, kill the process)
+    that cancel() runs from the racing thread, and poll cancelled between
+    steps that cannot be interrupted from outside.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self._aborts: List[Callable[[], Any]] = []
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            aborts = list(self._aborts)
+        for abort in aborts:
+            try:
+                abort()
+            except Exception:
+                pass
+
+    def add(self, abort: Callable[[], Any]):
+        with self._lock:
+            if not self.cancelled:
+                self._aborts.append(abort)
+                return
+        abort()
+
+    def remove(self, abort: Callable[[], Any]):
+        with self._lock:
+            if abort in self._aborts:
+                self._aborts.remove(abort)
+
+
+@contextmanager
+def _on_cancel(cancel: Optional[_CancelToken], abort: Callable[[], Any]):
+    """Run abort if cancel fires while the block is executing"""
+    if cancel is None:
+        yield
+        return
+    cancel.add(abort)
+    try:
+        yield
+    finally:
+        cancel.remove(abort)
+
+
+def _check_cancelled(cancel: Optional[_CancelToken]):
+    if cancel is not None and cancel.cancelled:
+        raise ConversionCancelled()
+
+
+def _cancelled(kwargs: Dict[str, Any]) -> bool:
+    cancel = kwargs.get('cancel')
+    return cancel is not None and cancel.cancelled
+
+
+# Chromium startup flags that trim background work in headless PDF rendering
+CHROME_STARTUP_FLAGS = [
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--disable-translate',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-first-run',
+    '--safebrowsing-disable-auto-update',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+]
+
+
+def _launch_chrome():
+    """Start a headless Chrome for Selenium"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    
+    # Chrome options for PDF generation
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-plugins')
+    chrome_options.add_argument('--run-all-compositor-stages-before-draw')
+    chrome_options.add_argument('--disable-background-timer-throttling')
+    chrome_options.add_argument('--disable-renderer-backgrounding')
+    chrome_options.add_argument('--disable-backgrounding-occluded-windows')
+    for flag in CHROME_STARTUP_FLAGS:
+        chrome_options.add_argument(flag)
+    
+    return webdriver.Chrome(options=chrome_options)
+
+
+def _launch_playwright():
+    """
+    Start a Playwright driver, a headless Chromium and one browser context
+    
+    The context lives as long as the browser so each conversion only pays
+    for a new page, not for a new context.
+    """
+    from playwright.sync_api import sync_playwright
+    
+    playwright = sync_playwright().start()
+    try:
+        browser = playwright.chromium.launch(args=CHROME_STARTUP_FLAGS)
+        context = browser.new_context(
+            viewport={'width': 1280, 'height': 1024},
+            device_scale_factor=1
+        )
+        return playwright, browser, context
+    except Exception:
+        playwright.stop()
+        raise
+
+
+def _close_playwright(handle):
+    playwright, browser, context = handle
+    try:
+        context.close()
+        browser.close()
+    finally:
+        playwright.stop()
+
+
+def _selenium_pool() -> BrowserPool:
+    return get_browser_pool('selenium', _launch_chrome, lambda d: d.quit())
+
+
+def _playwright_pool() -> BrowserPool:
+    return get_browser_pool('playwright', _launch_playwright, _close_playwright)
+
+
+# How long to wait for network activity and web fonts to settle before
+# printing anyway; slow or never-ending requests shouldn't fail a conversion
+READY_TIMEOUT_S = 10
+
+# Paper sizes in inches for --page-size
+PAPER_SIZES = {
+    'A4': (8.27, 11.69),
+    'Letter': (8.5, 11.0),
+}
+
+
+def _cdp_print_options(page_size: Optional[str]) -> Dict[str, Any]:
+    """Page.printToPDF parameters for the selected --page-size"""
+    print_options = {
+        'landscape': False,
+        'displayHeaderFooter': False,
+        'printBackground': True,
+        'marginTop': 0,
+        'marginBottom': 0,
+        'marginLeft': 0,
+        'marginRight': 0,
+        'scale': 1.0
+    }
+    
+    # Paper size is only sent when Chrome may actually use it
+    if page_size == 'css':
+        print_options['preferCSSPageSize'] = True
+    else:
+        width, height = PAPER_SIZES[page_size or 'A4']
+        print_options['paperWidth'] = width
+        print_options['paperHeight'] = height
+        # Without an explicit size, CSS @page wins and A4 is the fallback
+        print_options['preferCSSPageSize'] = page_size is None
+    
+    return print_options
+
+
+def _stream_cdp_pdf(
+    send: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+    print_options: Dict[str, Any],
+    output_file: str
+):
+    """
+    Print the current page via CDP, streaming the PDF to output_file
+    
+    With transferMode ReturnAsStream, Chrome hands back a stream handle that
+    is drained in chunks, so the whole document is never held in memory.
+    
+    Args:
+        send: Function issuing a CDP command, e.g. driver.execute_cdp_cmd
+        print_options: Page.printToPDF parameters
+        output_file: Path to output PDF file
+    """
+    result = send('Page.printToPDF', {'transferMode': 'ReturnAsStream', **print_options})
+    handle = result['stream']
+    try:
+        with open(output_file, 'wb') as f:
+            while True:
+                chunk = send('IO.read', {'handle': handle, 'size': 1 << 16})
+                if chunk.get('base64Encoded'):
+                    f.write(base64.b64decode(chunk['data']))
+                else:
+                    f.write(chunk['data'].encode())
+                if chunk.get('eof'):
+                    break
+    finally:
+        send('IO.close', {'handle': handle})
+
+
 def convert_with_selenium(html_file: str, output_file: str, **kwargs) -> bool:
     """
     Convert HTML to PDF using Selenium with Chrome (most reliable on macOS)
@@ -25,75 +418,220 @@ def convert_with_selenium(html_file: str, output_file: str, **kwargs) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
-        import json
-        import base64
-        
-        # Chrome options for PDF generation
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-plugins')
-        chrome_options.add_argument('--disable-images')
-        chrome_options.add_argument('--run-all-compositor-stages-before-draw')
-        chrome_options.add_argument('--disable-background-timer-throttling')
-        chrome_options.add_argument('--disable-renderer-backgrounding')
-        chrome_options.add_argument('--disable-backgrounding-occluded-windows')
-        
-        # Initialize Chrome driver
-        driver = webdriver.Chrome(options=chrome_options)
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
         
-        try:
-            # Load the HTML file
-            html_path = Path(html_file).resolve().as_uri()
-            driver.get(html_path)
-            
-            # Wait for page to load completely
-            time.sleep(3)
-            
-            # Execute JavaScript to trigger print
-            print_options = {
-                'landscape': False,
-                'displayHeaderFooter': False,
-                'printBackground': True,
-                'preferCSSPageSize': True,
-                'paperWidth': 8.27,  # A4 width in inches
-                'paperHeight': 11.69,  # A4 height in inches
-                'marginTop': 0,
-                'marginBottom': 0,
-                'marginLeft': 0,
-                'marginRight': 0,
-                'scale': 1.0
-            }
-            
-            # Use Chrome DevTools Protocol to generate PDF
-            result = driver.execute_cdp_cmd('Page.printToPDF', print_options)
-            
-            # Decode and save PDF
-            pdf_data = base64.b64decode(result['data'])
-            with open(output_file, 'wb') as f:
-                f.write(pdf_data)
-            
+        settle_ms = kwargs.get('settle_ms', 0)
+        page_size = kwargs.get('page_size')
+        cancel = kwargs.get('cancel')
+        
+        def render(driver):
+            # Quitting the driver from the racing thread aborts any pending
+            # WebDriver call; the pool then relaunches this slot
+            with _on_cancel(cancel, driver.quit):
+                # Load the HTML file (see convert_with_playwright for why this
+                # is a file:// navigation rather than an injected document)
+                html_path = _file_uri(str(html_file))
+                driver.get(html_path)
+                
+                # Wait for the document and its web fonts to finish loading
+                try:
+                    WebDriverWait(driver, READY_TIMEOUT_S).until(
+                        lambda d: d.execute_script("return document.readyState") == "complete"
+                        and d.execute_script(
+                            "return document.fonts ? document.fonts.status === 'loaded' : true"
+                        )
+                    )
+                except TimeoutException:
+                    print(f"⚠️  Page still loading after {READY_TIMEOUT_S}s, "
+                          f"printing anyway")
+                if settle_ms:
+                    time.sleep(settle_ms / 1000)
+                # No _check_cancelled() here: once cancelled the driver has
+                # been quit, so the next call fails and the slot is retired
+                
+                # Use Chrome DevTools Protocol to generate PDF
+                _stream_cdp_pdf(
+                    driver.execute_cdp_cmd, _cdp_print_options(page_size), output_file
+                )
+        
+        # Reuse a pooled Chrome instead of launching one per call
+        _selenium_pool().run(render)
+        
+        if kwargs.get('announce', True):
             print(f"✅ PDF generated successfully using Selenium: {output_file}")
-            return True
-            
-        finally:
-            driver.quit()
+        return True
         
     except ImportError:
         print("❌ Selenium not installed. Install with: pip install selenium")
         print("   Also requires Chrome browser to be installed")
         return False
     except Exception as e:
+        if _cancelled(kwargs):
+            return False
         print(f"❌ Selenium conversion failed: {e}")
         return False
 
 
+@lru_cache(maxsize=None)
+def _has(name: str) -> bool:
+    """Check whether a backend module is installed, without importing it"""
+    return importlib.util.find_spec(name) is not None
+
+
+def _file_uri(path: str) -> str:
+    """Resolve a path to a file:// URI"""
+    return Path(path).resolve().as_uri()
+
+
+@lru_cache(maxsize=None)
+def _get_weasyprint():
+    """Import WeasyPrint once and return the classes used for conversion"""
+    from weasyprint import HTML, CSS
+    from weasyprint.text.fonts import FontConfiguration
+    
+    return HTML, CSS, FontConfiguration
+
+
+# Custom CSS for print optimization
+PRINT_CSS_TEXT = '''
+    @page {
+        size: A4;
+        margin: 0;
+        -webkit-print-color-adjust: exact;
+        color-adjust: exact;
+    }
+    
+    body {
+        -webkit-print-color-adjust: exact;
+        color-adjust: exact;
+    }
+    
+    * {
+        -webkit-print-color-adjust: exact;
+        color-adjust: exact;
+    }
+'''
+
+_PRINT_CSS = None
+_FONT_CONFIG = None
+_weasyprint_lock = threading.Lock()
+
+
+def _get_weasyprint_styles():
+    """
+    Return the shared print stylesheet and font configuration
+    
+    Parsing the stylesheet is far more expensive than rendering a poster,
+    so it is built once per process and reused by every conversion.
+    """
+    global _PRINT_CSS, _FONT_CONFIG
+    with _weasyprint_lock:
+        if _PRINT_CSS is None:
+            _, CSS, FontConfiguration = _get_weasyprint()
+            _FONT_CONFIG = FontConfiguration()
+            _PRINT_CSS = CSS(string=PRINT_CSS_TEXT, font_config=_FONT_CONFIG)
+    return _PRINT_CSS, _FONT_CONFIG
+
+
+# write_pdf() settings shared by serial and parallel WeasyPrint rendering
+WEASYPRINT_WRITE_OPTIONS = {
+    'pdf_version': '1.7',
+}
+
+
+def _weasyprint_image_options(**kwargs) -> Dict[str, Any]:
+    """
+    WeasyPrint image settings requested by the caller
+    
+    Re-encoding embedded images is opt-in: posters usually ship images that
+    are already optimized, and recompressing them is pure CPU cost.
+    """
+    options = {}
+    if kwargs.get('optimize_images') is not None:
+        options['optimize_images'] = kwargs['optimize_images']
+    if kwargs.get('jpeg_quality') is not None:
+        options['jpeg_quality'] = kwargs['jpeg_quality']
+    return options
+
+# Below this many pages, worker start-up outweighs parallel rendering gains
+PARALLEL_PAGES_MIN = 4
+
+
+def _render_weasyprint_pages(
+    html_file: str,
+    start: int,
+    stop: int,
+    image_options: Dict[str, Any]
+) -> bytes:
+    """
+    Render pages [start, stop) of html_file to PDF bytes (process pool worker)
+    
+    WeasyPrint documents cannot be pickled, so each worker lays the document
+    out again (layout is deterministic) and only draws its own page range.
+    """
+    HTML, _, _ = _get_weasyprint()
+    print_css, font_config = _get_weasyprint_styles()
+    write_options = dict(
+        WEASYPRINT_WRITE_OPTIONS, stylesheets=[print_css], **image_options
+    )
+    
+    document = HTML(filename=html_file).render(font_config=font_config, **write_options)
+    return document.copy(document.pages[start:stop]).write_pdf(**write_options)
+
+
+def _write_weasyprint_parallel(
+    document,
+    html_file: str,
+    output_file: str,
+    image_options: Dict[str, Any],
+    write_options: Dict[str, Any]
+):
+    """
+    Draw page ranges concurrently and concatenate them with pypdf
+    
+    The parent draws the first range from the document it has already laid
+    out while worker processes lay out and draw the remaining ranges.
+    """
+    from pypdf import PdfReader, PdfWriter
+    
+    page_count = len(document.pages)
+    # Processes rather than threads: WeasyPrint holds the GIL while drawing
+    workers = min(os.cpu_count() or 1, page_count)
+    if workers < 2:
+        document.write_pdf(output_file, **write_options)
+        return
+    
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    # Spawn rather than fork: this may run beside browser pool and race
+    # threads, which a forked child would inherit in an undefined state
+    with ProcessPoolExecutor(
+        max_workers=workers - 1,
+        mp_context=multiprocessing.get_context('spawn')
+    ) as executor:
+        futures = [
+            executor.submit(
+                _render_weasyprint_pages, html_file, start, stop, image_options
+            )
+            for start, stop in zip(bounds[1:-1], bounds[2:])
+        ]
+        first = document.copy(document.pages[:bounds[1]]).write_pdf(**write_options)
+        parts = [first] + [future.result() for future in futures]
+    
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(PdfReader(io.BytesIO(part)))
+    # Keep the title, author and dates WeasyPrint wrote, and its PDF version
+    # rather than pypdf's default 1.3 header
+    metadata = PdfReader(io.BytesIO(parts[0])).metadata
+    if metadata:
+        writer.add_metadata(metadata)
+    if write_options.get('pdf_version'):
+        writer.pdf_header = f"%PDF-{write_options['pdf_version']}"
+    with open(output_file, 'wb') as f:
+        writer.write(f)
+
+
 def convert_with_weasyprint(html_file: str, output_file: str, **kwargs) -> bool:
     """
     Convert HTML to PDF using WeasyPrint (best for CSS support)
@@ -107,52 +645,99 @@ def convert_with_weasyprint(html_file: str, output_file: str, **kwargs) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        import weasyprint
-        from weasyprint import HTML, CSS
+        HTML, _, _ = _get_weasyprint()
         
         # High-quality PDF settings
         html_doc = HTML(filename=html_file)
+        print_css, font_config = _get_weasyprint_styles()
+        image_options = _weasyprint_image_options(**kwargs)
+        write_options = dict(
+            WEASYPRINT_WRITE_OPTIONS, stylesheets=[print_css], **image_options
+        )
         
-        # Custom CSS for print optimization
-        print_css = CSS(string='''
-            @page {
-                size: A4;
-                margin: 0;
-                -webkit-print-color-adjust: exact;
-                color-adjust: exact;
-            }
-            
-            body {
-                -webkit-print-color-adjust: exact;
-                color-adjust: exact;
-            }
-            
-            * {
-                -webkit-print-color-adjust: exact;
-                color-adjust: exact;
-            }
-        ''')
+        document = html_doc.render(font_config=font_config, **write_options)
+        page_count = len(document.pages)
+        _check_cancelled(kwargs.get('cancel'))
+        
+        if kwargs.get('parallel_pages') and page_count >= PARALLEL_PAGES_MIN:
+            if _has('pypdf'):
+                _write_weasyprint_parallel(
+                    document, html_file, output_file, image_options, write_options
+                )
+                if kwargs.get('announce', True):
+                    print(f"✅ PDF generated successfully using WeasyPrint "
+                          f"({page_count} pages in parallel): {output_file}")
+                return True
+            print("⚠️  pypdf not installed, rendering pages serially. "
+                  "Install with: pip install pypdf")
         
         # Generate PDF with high quality settings
-        html_doc.write_pdf(
-            output_file,
-            stylesheets=[print_css],
-            optimize_images=True,
-            jpeg_quality=95,
-            pdf_version='1.7'
-        )
+        document.write_pdf(output_file, **write_options)
         
-        print(f"✅ PDF generated successfully using WeasyPrint: {output_file}")
+        if kwargs.get('announce', True):
+            print(f"✅ PDF generated successfully using WeasyPrint: {output_file}")
         return True
         
     except ImportError:
         print("❌ WeasyPrint not installed. Install with: pip install weasyprint")
         return False
     except Exception as e:
+        if _cancelled(kwargs):
+            return False
         print(f"❌ WeasyPrint conversion failed: {e}")
         return False
 
 
+def _wkhtmltopdf_args(options: Dict[str, Any]) -> List[str]:
+    """
+    Turn a pdfkit options dict into wkhtmltopdf arguments, as pdfkit does
+    
+    Keys get a '--' prefix unless they already have one. None and booleans
+    give a bare flag. A list or tuple repeats the flag once per item, and
+    (name, value) pair items such as cookies expand to two arguments.
+    """
+    args = []
+    for key, value in options.items():
+        flag = key if key.startswith('--') else f'--{key.lower()}'
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            args.append(flag)
+            if isinstance(item, (list, tuple)):
+                name, item_value = item
+                args += [str(name), str(item_value)]
+            elif item is not None and not isinstance(item, bool) and item != '':
+                args.append(str(item))
+    return args
+
+
+def _run_wkhtmltopdf(
+    wkhtmltopdf: str,
+    html_file: str,
+    output_file: str,
+    options: Dict[str, Any],
+    cancel: Optional[_CancelToken] = None
+):
+    """
+    Run wkhtmltopdf directly with pdfkit-style options
+    
+    The input is passed by path rather than piped through stdin: wkhtmltopdf
+    spools stdin to a temporary file, which breaks relative image and
+    stylesheet links.
+    """
+    args = [wkhtmltopdf, '--quiet', *_wkhtmltopdf_args(options)]
+    args += [str(html_file), str(output_file)]
+    
+    with subprocess.Popen(
+        args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    ) as proc, _on_cancel(cancel, proc.kill):
+        _, stderr = proc.communicate()
+    _check_cancelled(cancel)
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"wkhtmltopdf exited with code {proc.returncode}: "
+            f"{stderr.decode(errors='replace').strip()}"
+        )
+
+
 def convert_with_pdfkit(html_file: str, output_file: str, **kwargs) -> bool:
     """
     Convert HTML to PDF using pdfkit/wkhtmltopdf (good for complex layouts)
@@ -166,8 +751,6 @@ def convert_with_pdfkit(html_file: str, output_file: str, **kwargs) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        import pdfkit
-        
         # High-quality PDF options
         options = {
             'page-size': 'A4',
@@ -183,7 +766,6 @@ def convert_with_pdfkit(html_file: str, output_file: str, **kwargs) -> bool:
             'dpi': 300,
             'image-quality': 100,
             'image-dpi': 300,
-            'lowquality': False,
             'zoom': 1.0,
             'viewport-size': '1280x1024',
             'javascript-delay': 1000,
@@ -191,12 +773,25 @@ def convert_with_pdfkit(html_file: str, output_file: str, **kwargs) -> bool:
             'load-media-error-handling': 'ignore'
         }
         
+        # wkhtmltopdf always recompresses images, so there is no re-encoding
+        # to skip; only the JPEG quality it uses can be chosen
+        if kwargs.get('jpeg_quality') is not None:
+            options['image-quality'] = kwargs['jpeg_quality']
+        
         # Update with any custom options
         options.update(kwargs.get('pdfkit_options', {}))
         
-        pdfkit.from_file(html_file, output_file, options=options)
+        wkhtmltopdf = shutil.which('wkhtmltopdf')
+        if wkhtmltopdf:
+            _run_wkhtmltopdf(
+                wkhtmltopdf, html_file, output_file, options, kwargs.get('cancel')
+            )
+        else:
+            import pdfkit
+            pdfkit.from_file(html_file, output_file, options=options)
         
-        print(f"✅ PDF generated successfully using pdfkit: {output_file}")
+        if kwargs.get('announce', True):
+            print(f"✅ PDF generated successfully using pdfkit: {output_file}")
         return True
         
     except ImportError:
@@ -204,6 +799,8 @@ def convert_with_pdfkit(html_file: str, output_file: str, **kwargs) -> bool:
         print("   Also requires wkhtmltopdf: https://wkhtmltopdf.org/downloads.html")
         return False
     except Exception as e:
+        if _cancelled(kwargs):
+            return False
         print(f"❌ pdfkit conversion failed: {e}")
         return False
 
@@ -221,36 +818,87 @@ def convert_with_playwright(html_file: str, output_file: str, **kwargs) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        from playwright.sync_api import sync_playwright
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page()
-            
-            # Load the HTML file
-            html_path = Path(html_file).resolve().as_uri()
-            page.goto(html_path)
-            
-            # Wait for any animations or dynamic content
-            page.wait_for_timeout(2000)
-            
-            # High-quality PDF options
-            pdf_options = {
-                'path': output_file,
-                'format': 'A4',
-                'margin': {'top': '0', 'right': '0', 'bottom': '0', 'left': '0'},
-                'print_background': True,
-                'prefer_css_page_size': True,
-                'scale': 1.0
-            }
-            
-            # Update with any custom options
-            pdf_options.update(kwargs.get('playwright_options', {}))
-            
-            page.pdf(**pdf_options)
-            browser.close()
-            
-        print(f"✅ PDF generated successfully using Playwright: {output_file}")
+        settle_ms = kwargs.get('settle_ms', 0)
+        page_size = kwargs.get('page_size')
+        cancel = kwargs.get('cancel')
+        
+        def render(handle):
+            _, _, context = handle
+            page = context.new_page()
+            try:
+                # Load the HTML file. Navigate to its file:// URL rather than
+                # using page.set_content(): set_content() leaves the page on
+                # about:blank, whose opaque origin may not load file:// images
+                # or stylesheets even with a <base href> pointing at them.
+                # Chromium reads the file itself, so large inlined images
+                # never cross the DevTools socket as JSON either.
+                html_path = _file_uri(str(html_file))
+                page.goto(html_path, wait_until='load')
+                # Playwright objects can only be used from this thread, so
+                # a lost race is noticed between steps rather than mid-call
+                _check_cancelled(cancel)
+                
+                # Wait for late requests and web fonts, plus an optional
+                # fixed settle delay
+                try:
+                    page.wait_for_load_state(
+                        'networkidle', timeout=READY_TIMEOUT_S * 1000
+                    )
+                    page.wait_for_function(
+                        "document.fonts ? document.fonts.status === 'loaded' : true",
+                        timeout=READY_TIMEOUT_S * 1000
+                    )
+                except PlaywrightTimeoutError:
+                    print(f"⚠️  Page still loading after {READY_TIMEOUT_S}s, "
+                          f"printing anyway")
+                _check_cancelled(cancel)
+                if settle_ms:
+                    page.wait_for_timeout(settle_ms)
+                _check_cancelled(cancel)
+                
+                playwright_options = kwargs.get('playwright_options')
+                if not playwright_options:
+                    # Stream the PDF over a raw CDP session: page.pdf() reads
+                    # the whole document into memory before writing 'path'
+                    cdp = context.new_cdp_session(page)
+                    try:
+                        _stream_cdp_pdf(
+                            cdp.send, _cdp_print_options(page_size), output_file
+                        )
+                    finally:
+                        cdp.detach()
+                    return
+                
+                # Custom Playwright options need page.pdf(), which buffers
+                # the whole PDF in memory
+                pdf_options = {
+                    'path': output_file,
+                    'format': 'A4',
+                    'margin': {'top': '0', 'right': '0', 'bottom': '0', 'left': '0'},
+                    'print_background': True,
+                    'prefer_css_page_size': True,
+                    'scale': 1.0
+                }
+                if page_size == 'css':
+                    del pdf_options['format']
+                elif page_size is not None:
+                    pdf_options['format'] = page_size
+                    pdf_options['prefer_css_page_size'] = False
+                
+                # Update with any custom options
+                pdf_options.update(playwright_options)
+                
+                page.pdf(**pdf_options)
+            finally:
+                page.close()
+        
+        # Reuse a pooled Chromium instead of launching one per call
+        _playwright_pool().run(render)
+        
+        if kwargs.get('announce', True):
+            print(f"✅ PDF generated successfully using Playwright: {output_file}")
         return True
         
     except ImportError:
@@ -258,14 +906,323 @@ def convert_with_playwright(html_file: str, output_file: str, **kwargs) -> bool:
         print("   Then run: playwright install chromium")
         return False
     except Exception as e:
+        if _cancelled(kwargs):
+            return False
         print(f"❌ Playwright conversion failed: {e}")
         return False
 
 
+# Per-user cache for backend stats and preflighted images
+CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'convert_to_pdf'
+
+# CSS pixels per inch, used to turn <img> width/height into print inches
+CSS_PX_PER_INCH = 96
+
+# Assumed rendered width for images without size attributes (A4 width)
+DEFAULT_IMAGE_WIDTH_IN = 8.27
+
+# Only downscale images at least this much larger than needed
+PREFLIGHT_OVERSIZE_RATIO = 1.2
+
+
+def _css_px(value: Optional[str]) -> Optional[float]:
+    """Parse an <img> width/height attribute in CSS pixels, if it is one"""
+    try:
+        return float(value.strip().lower().removesuffix('px'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _to_rgb(img, icc_profile: Optional[bytes]) -> Tuple[Any, Optional[bytes]]:
+    """
+    Convert a CMYK or greyscale image to RGB for JPEG output
+    
+    The source ICC profile describes the old colour space, so it cannot be
+    kept; colours are converted through it to sRGB, which is what viewers
+    assume for untagged RGB. Without a profile, or if the conversion fails,
+    this is a plain mode conversion.
+    """
+    if icc_profile:
+        try:
+            from PIL import ImageCms
+            
+            converted = ImageCms.profileToProfile(
+                img, ImageCms.ImageCmsProfile(io.BytesIO(icc_profile)),
+                ImageCms.createProfile('sRGB'), outputMode='RGB'
+            )
+            return converted, None
+        except Exception:
+            pass
+    return img.convert('RGB'), None
+
+
+def _downscale_image(image_path: Path, cache_dir: Path, target_dpi: int,
+                     width_px: Optional[float], height_px: Optional[float]) -> Optional[Path]:
+    """
+    Return a cached downscaled copy of image_path, or None if it is small enough
+    
+    The target size is the rendered size (from the <img> width/height
+    attributes, else the page width) at target_dpi. Copies are keyed by the
+    source's mtime and size plus the target, so edits invalidate them.
+    EXIF orientation is applied and the ICC profile kept (or, where the
+    image has to change colour space, applied), so rotated photos stay
+    upright and wide-gamut images keep their colours.
+    """
+    from PIL import Image, ImageOps
+    
+    if width_px is None and height_px is None:
+        max_w, max_h = DEFAULT_IMAGE_WIDTH_IN * target_dpi, float('inf')
+    else:
+        max_w = width_px / CSS_PX_PER_INCH * target_dpi if width_px else float('inf')
+        max_h = height_px / CSS_PX_PER_INCH * target_dpi if height_px else float('inf')
+    
+    with Image.open(image_path) as img:
+        # EXIF orientations 5-8 display the image rotated by 90 degrees
+        width, height = img.size
+        if img.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+            width, height = height, width
+        if (width <= max_w * PREFLIGHT_OVERSIZE_RATIO
+                and height <= max_h * PREFLIGHT_OVERSIZE_RATIO):
+            return None
+        
+        stat = image_path.stat()
+        key = f"{image_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{max_w}:{max_h}"
+        has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+        suffix = '.png' if has_alpha else '.jpg'
+        cached = cache_dir / (
+            f"{image_path.stem}.{hashlib.sha1(key.encode()).hexdigest()[:12]}{suffix}"
+        )
+        if cached.exists():
+            return cached
+        
+        icc_profile = img.info.get('icc_profile')
+        img = ImageOps.exif_transpose(img)
+        size = (int(min(max_w, width)), int(min(max_h, height)))
+        img.thumbnail(size, Image.LANCZOS)
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cached.with_suffix(f'.{os.getpid()}.{threading.get_ident()}{suffix}')
+        if has_alpha:
+            img.save(tmp_path, 'PNG', optimize=True, icc_profile=icc_profile)
+        else:
+            if img.mode != 'RGB':
+                img, icc_profile = _to_rgb(img, icc_profile)
+            img.save(
+                tmp_path, 'JPEG', quality=85, optimize=True, progressive=True,
+                icc_profile=icc_profile
+            )
+        os.replace(tmp_path, cached)
+        return cached
+
+
+def preflight_images(html_file: str, target_dpi: int = 300) -> str:
+    """
+    Downscale images that are far larger than they will be printed
+    
+    Oversized rasters dominate both conversion time and PDF size. Each local
+    <img> whose pixel size exceeds its rendered size at target_dpi is replaced
+    by a cached, downscaled copy under CACHE_DIR, referenced by file:// URI.
+    
+    Args:
+        html_file: Path to HTML file
+        target_dpi: Print resolution to keep images at
+    
+    Returns:
+        str: Path to a temporary rewritten copy of html_file in the same
+            directory (the caller deletes it), or html_file if nothing changed
+    """
+    try:
+        import lxml.html
+        import PIL  # noqa: F401
+    except ImportError:
+        print("⚠️  Image preflight needs lxml and Pillow. "
+              "Install with: pip install lxml Pillow")
+        return html_file
+    
+    html_dir = Path(html_file).resolve().parent
+    cache_dir = CACHE_DIR / 'images'
+    try:
+        tree = lxml.html.parse(html_file)
+    except Exception as e:
+        print(f"⚠️  Could not parse {html_file} for image preflight: {e}")
+        return html_file
+    changed = 0
+    
+    for img in tree.iter('img'):
+        src = img.get('src')
+        if not src or src.startswith('//') or urlparse(src).scheme:
+            continue
+        image_path = html_dir / unquote(urlparse(src).path)
+        if not image_path.is_file():
+            continue
+        try:
+            cached = _downscale_image(
+                image_path, cache_dir, target_dpi,
+                _css_px(img.get('width')), _css_px(img.get('height'))
+            )
+        except Exception as e:
+            print(f"⚠️  Could not preflight {src}: {e}")
+            continue
+        if cached is not None:
+            img.set('src', cached.as_uri())
+            changed += 1
+    
+    if not changed:
+        return html_file
+    
+    try:
+        fd, optimized = tempfile.mkstemp(
+            suffix='.opt.html', prefix=f'.{Path(html_file).stem}.', dir=html_dir
+        )
+    except OSError as e:
+        print(f"⚠️  Could not write preflighted copy of {html_file}: {e}")
+        return html_file
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            tree.write(f, method='html', encoding='utf-8')
+    except OSError as e:
+        print(f"⚠️  Could not write preflighted copy of {html_file}: {e}")
+        os.unlink(optimized)
+        return html_file
+    print(f"🖼️  Downscaled {changed} oversized image(s) for {html_file}")
+    return optimized
+
+
+STATS_PATH = CACHE_DIR / 'stats.json'
+
+# Weight of the newest run in each backend's moving average wall time
+STATS_EWMA_ALPHA = 0.3
+
+_stats: Optional[Dict[str, Dict[str, float]]] = None
+_stats_lock = threading.Lock()
+
+
+def _valid_stats(data: Any) -> bool:
+    """Check that data loaded from STATS_PATH has the shape written to it"""
+    def number(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    
+    if not isinstance(data, dict):
+        return False
+    for entry in data.values():
+        if not (isinstance(entry, dict)
+                and number(entry.get('runs')) and number(entry.get('ewma_ms'))):
+            return False
+        if not all(number(entry[key]) for key in ('last_success', 'last_failure')
+                   if key in entry):
+            return False
+    return True
+
+
+def _load_stats() -> Dict[str, Dict[str, float]]:
+    global _stats
+    if _stats is None:
+        try:
+            with open(STATS_PATH) as f:
+                _stats = json.load(f)
+        except (OSError, ValueError):
+            _stats = {}
+        # A hand-edited or foreign file is ignored rather than crashing later
+        if not _valid_stats(_stats):
+            _stats = {}
+    return _stats
+
+
+def record_backend_run(
+    method: str,
+    ok: bool,
+    elapsed_ms: float,
+    lower_bound: bool = False
+):
+    """
+    Fold one auto-mode attempt into the persisted per-backend stats
+    
+    Args:
+        method: Backend name
+        ok: Whether the attempt succeeded
+        elapsed_ms: Wall time of the attempt
+        lower_bound: The attempt lost a race and was cancelled after
+            elapsed_ms, so it would have needed at least that long
+    """
+    with _stats_lock:
+        stats = _load_stats()
+        entry = stats.setdefault(method, {'ewma_ms': elapsed_ms, 'runs': 0})
+        if ok or lower_bound:
+            if lower_bound and entry['runs']:
+                elapsed_ms = max(elapsed_ms, entry['ewma_ms'])
+            if entry['runs']:
+                entry['ewma_ms'] += STATS_EWMA_ALPHA * (elapsed_ms - entry['ewma_ms'])
+            else:
+                entry['ewma_ms'] = elapsed_ms
+            entry['runs'] += 1
+            if ok:
+                entry['last_success'] = time.time()
+        else:
+            entry['last_failure'] = time.time()
+        
+        try:
+            STATS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = STATS_PATH.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(stats, f, indent=2)
+            os.replace(tmp_path, STATS_PATH)
+        except OSError:
+            pass
+
+
+def reset_stats():
+    """Forget all recorded backend timings"""
+    global _stats
+    with _stats_lock:
+        _stats = {}
+        try:
+            STATS_PATH.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _order_by_stats(
+    methods: List[Tuple[str, Callable]],
+    explore: bool = False
+) -> List[Tuple[str, Callable]]:
+    """
+    Sort auto-mode candidates by recorded speed
+    
+    Measured backends come first, fastest EWMA first, with more recent
+    successes breaking ties. Backends that have never been measured follow
+    in their default order, and those whose latest attempt failed go last.
+    
+    With explore set, the first never-measured backend is moved into second
+    place, so racing it against the current favourite measures it.
+    """
+    with _stats_lock:
+        stats = _load_stats()
+    
+    def key(item):
+        index, (name, _) = item
+        entry = stats.get(name)
+        if not entry:
+            return (1, index)
+        if entry['runs'] and entry.get('last_success', 0) >= entry.get('last_failure', 0):
+            return (0, entry['ewma_ms'], -entry.get('last_success', 0))
+        return (2, index)
+    
+    ranked = sorted(enumerate(methods), key=key)
+    if explore:
+        unmeasured = [i for i, item in enumerate(ranked) if key(item)[0] == 1]
+        if unmeasured and unmeasured[0] > 1:
+            ranked.insert(1, ranked.pop(unmeasured[0]))
+    return [item for _, item in ranked]
+
+
 def html_to_pdf(
     html_file: str,
     output_file: Optional[str] = None,
     method: str = "auto",
+    use_stats: bool = True,
+    race: bool = False,
     **kwargs
 ) -> bool:
     """
@@ -275,6 +1232,14 @@ def html_to_pdf(
         html_file: Path to HTML file
         output_file: Output PDF path (defaults to same name with .pdf extension)
         method: Conversion method ('weasyprint', 'pdfkit', 'playwright', or 'auto')
+        use_stats: In auto mode, try backends in order of their recorded
+            speed and record the outcome of each attempt
+        race: In auto mode, run the two preferred backends at once, keep
+            whichever succeeds first and cancel the other. Leave this off
+            when converting several files concurrently: a loser that can't
+            be interrupted still costs a full conversion.
+        preflight_images: Downscale oversized local images before converting
+        target_dpi: Resolution preflight_images downscales to (default: 300)
         **kwargs: Additional options for specific converters
     
     Returns:
@@ -292,6 +1257,185 @@ def html_to_pdf(
     
     print(f"🔄 Converting {html_file} to {output_file}")
     
+    # Shrink oversized images into a temporary copy of the page
+    source_file = html_file
+    if kwargs.pop('preflight_images', False):
+        source_file = preflight_images(html_file, kwargs.pop('target_dpi', 300))
+    kwargs.pop('target_dpi', None)
+    
+    try:
+        return _convert(source_file, output_file, method, use_stats, race, **kwargs)
+    finally:
+        if source_file != html_file:
+            os.unlink(source_file)
+
+
+def _run_in_daemon_thread(fn: Callable, *args, **kwargs) -> Future:
+    """
+    Run fn in a daemon thread
+    
+    Unlike ThreadPoolExecutor workers, daemon threads are not joined at exit,
+    so a hung backend cannot keep the process alive after another one won.
+    """
+    future: Future = Future()
+    
+    def target():
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+# Process umask, read once at import while no other threads exist
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _output_mode(output_file: str) -> int:
+    """Permissions a directly written output_file would get"""
+    try:
+        return stat.S_IMODE(os.stat(output_file).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+# Temporary outputs of race losers still running, removed at exit if need be
+_abandoned_outputs: set = set()
+
+
+def _discard(path: str):
+    _abandoned_outputs.discard(path)
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+@atexit.register
+def _discard_abandoned_outputs():
+    for path in list(_abandoned_outputs):
+        _discard(path)
+
+
+def _attempt(
+    method_name: str,
+    converter: Callable[..., bool],
+    html_file: str,
+    output_file: str,
+    use_stats: bool,
+    **kwargs
+) -> bool:
+    """Run one auto-mode converter, recording its outcome"""
+    start = time.perf_counter()
+    try:
+        # output_file is a temporary path; _auto_convert reports the real one
+        ok = converter(html_file, output_file, announce=False, **kwargs)
+    except Exception as e:
+        if not _cancelled(kwargs):
+            print(f"❌ {method_name} conversion failed: {e}")
+        ok = False
+    if _cancelled(kwargs):
+        print(f"⏹️  Cancelled {method_name}")
+        return False
+    if use_stats:
+        record_backend_run(method_name, ok, (time.perf_counter() - start) * 1000)
+    return ok
+
+
+def _abandon(running: Dict[Future, Tuple[str, str, _CancelToken, float]]):
+    """Cancel running attempts and drop their output once they stop"""
+    for future, (_, tmp_path, cancel, _) in running.items():
+        _abandoned_outputs.add(tmp_path)
+        future.add_done_callback(lambda _, path=tmp_path: _discard(path))
+        cancel.cancel()
+
+
+def _auto_convert(
+    methods: List[Tuple[str, Callable[..., bool]]],
+    html_file: str,
+    output_file: str,
+    use_stats: bool,
+    race: bool,
+    **kwargs
+) -> bool:
+    """
+    Try converters in order until one succeeds
+    
+    With race set, two converters run at a time and the first success wins;
+    a hung backend then costs no more than the fastest working one. The
+    loser is cancelled: Selenium drivers are quit and wkhtmltopdf is killed
+    at once, while Playwright and WeasyPrint stop at their next step. Every
+    attempt writes to its own temporary file next to output_file, and only
+    the winner is moved into place, so a slower loser can never leave a torn
+    or stale PDF behind.
+    """
+    output_dir = Path(output_file).resolve().parent
+    remaining = list(methods)
+    running: Dict[Future, Tuple[str, str, _CancelToken, float]] = {}
+    
+    while remaining or running:
+        while remaining and len(running) < (2 if race else 1):
+            method_name, converter = remaining.pop(0)
+            print(f"🔄 Trying {method_name}...")
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    suffix='.pdf', prefix=f'.{method_name}.', dir=output_dir
+                )
+                os.close(fd)
+                # mkstemp creates 0600 files; give the PDF the usual permissions
+                os.chmod(tmp_path, _output_mode(output_file))
+            except OSError as e:
+                print(f"❌ Cannot write to {output_dir}: {e}")
+                _abandon(running)
+                return False
+            cancel = _CancelToken()
+            future = _run_in_daemon_thread(
+                _attempt, method_name, converter, html_file, tmp_path,
+                use_stats, cancel=cancel, **kwargs
+            )
+            running[future] = (method_name, tmp_path, cancel, time.perf_counter())
+        
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            method_name, tmp_path, _, _ = running.pop(future)
+            if future.result():
+                try:
+                    os.replace(tmp_path, output_file)
+                except OSError as e:
+                    print(f"❌ Cannot write {output_file}: {e}")
+                    _discard(tmp_path)
+                    _abandon(running)
+                    return False
+                # Cancel the losers and drop their output once they stop
+                _abandon(running)
+                for loser_name, _, _, loser_start in running.values():
+                    # Recorded here, not by the loser: the process may exit
+                    # before a cancelled attempt gets to report back
+                    if use_stats:
+                        record_backend_run(
+                            loser_name, False,
+                            (time.perf_counter() - loser_start) * 1000,
+                            lower_bound=True
+                        )
+                print(f"✅ PDF generated successfully using {method_name}: {output_file}")
+                return True
+            _discard(tmp_path)
+    
+    return False
+
+
+def _convert(
+    html_file: str,
+    output_file: str,
+    method: str,
+    use_stats: bool,
+    race: bool,
+    **kwargs
+) -> bool:
+    """Run the requested converter, or try each one in auto mode"""
     # Try conversion methods
     if method == "auto":
         # Try methods in order of preference
@@ -302,10 +1446,21 @@ def html_to_pdf(
             ("pdfkit", convert_with_pdfkit)
         ]
         
-        for method_name, converter in methods:
-            print(f"🔄 Trying {method_name}...")
-            if converter(html_file, output_file, **kwargs):
-                return True
+        # Only pay the import cost of backends that are actually installed
+        available = [
+            (name, converter) for name, converter in methods
+            if _has(name) or (name == 'pdfkit' and shutil.which('wkhtmltopdf'))
+        ]
+        if not available:
+            print("❌ No conversion backend installed. "
+                  "Install one with: pip install -r requirements.txt")
+            return False
+        
+        if use_stats:
+            available = _order_by_stats(available, explore=race)
+        
+        if _auto_convert(available, html_file, output_file, use_stats, race, **kwargs):
+            return True
         
         print("❌ All conversion methods failed")
         return False
@@ -323,6 +1478,169 @@ def html_to_pdf(
         return False
 
 
+# Per user, so one user's server never blocks or answers another's: the
+# private runtime directory where there is one, else a uid-named socket
+DEFAULT_SOCKET_PATH = os.environ.get('CONVERT_TO_PDF_SOCKET') or (
+    os.path.join(os.environ['XDG_RUNTIME_DIR'], 'convert_to_pdf.sock')
+    if os.environ.get('XDG_RUNTIME_DIR')
+    else os.path.join(
+        tempfile.gettempdir(), f"convert_to_pdf-{getattr(os, 'getuid', os.getpid)()}.sock"
+    )
+)
+
+
+class _ConversionHandler(socketserver.StreamRequestHandler):
+    """Handle newline-delimited JSON conversion requests on one connection"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            start = time.perf_counter()
+            try:
+                job = json.loads(line)
+                ok = html_to_pdf(
+                    job['html'],
+                    job.get('output'),
+                    method=job.get('method', 'auto'),
+                    # Requests are served concurrently, so no racing
+                    **dict(job.get('options', {}), race=False)
+                )
+                response = {'ok': ok}
+                if not ok:
+                    response['error'] = 'conversion failed, see server log'
+            except Exception as e:
+                response = {'ok': False, 'error': str(e)}
+            response['elapsed_ms'] = int((time.perf_counter() - start) * 1000)
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+
+def warm_up(method: str = "auto"):
+    """Preload WeasyPrint and launch one pooled browser per installed backend"""
+    if method in ("auto", "weasyprint") and _has('weasyprint'):
+        try:
+            _get_weasyprint_styles()
+        except Exception as e:
+            print(f"⚠️  Could not preload WeasyPrint: {e}")
+    
+    pools = {'selenium': _selenium_pool, 'playwright': _playwright_pool}
+    for name, get_pool in pools.items():
+        if method in ("auto", name) and _has(name):
+            try:
+                get_pool().run(lambda browser: None)
+            except Exception as e:
+                print(f"⚠️  Could not launch {name} browser: {e}")
+
+
+def _clear_stale_socket(socket_path: str) -> bool:
+    """
+    Remove a leftover socket from a dead server
+    
+    Returns:
+        bool: True if socket_path is now free, False if it is a live server's
+            socket or not a socket at all
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return True
+    except OSError as e:
+        print(f"❌ Cannot use {socket_path}: {e}")
+        return False
+    if not stat.S_ISSOCK(mode):
+        print(f"❌ {socket_path} exists and is not a socket")
+        return False
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except ConnectionRefusedError:
+            try:
+                os.unlink(socket_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"❌ Cannot remove stale socket {socket_path}: {e}")
+                return False
+            return True
+        except OSError as e:
+            # e.g. another user's socket in a shared directory
+            print(f"❌ Cannot use {socket_path}: {e}")
+            return False
+    print(f"❌ A conversion server is already listening on {socket_path}")
+    return False
+
+
+def serve(
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    warm: bool = False,
+    method: str = "auto"
+) -> bool:
+    """
+    Run a long-lived conversion server on a Unix socket
+    
+    Each request is one JSON line ``{"html", "output", "method", "options"}``
+    and gets a JSON line ``{"ok", "error"?, "elapsed_ms"}`` back. Imports and
+    pooled browsers survive between requests, so only the first conversion
+    pays their start-up cost.
+    
+    Args:
+        socket_path: Path of the Unix socket to listen on
+        warm: Preload backends before accepting requests
+        method: Backend to preload when warm is set
+    
+    Returns:
+        bool: False if the socket could not be claimed, True after shutdown
+    """
+    if not _clear_stale_socket(socket_path):
+        return False
+    
+    if warm:
+        print("🔄 Warming up conversion backends...")
+        warm_up(method)
+    
+    with socketserver.ThreadingUnixStreamServer(socket_path, _ConversionHandler) as server:
+        print(f"🚀 Listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+    return True
+
+
+def request_conversion(
+    html_file: str,
+    output_file: Optional[str] = None,
+    method: str = "auto",
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    **options
+) -> Dict[str, Any]:
+    """
+    Ask a running conversion server (see serve()) to convert one file
+    
+    Returns:
+        dict: The server response with 'ok', 'elapsed_ms' and optional 'error'
+    """
+    job = {
+        'html': os.path.abspath(html_file),
+        'output': os.path.abspath(output_file) if output_file else None,
+        'method': method,
+        'options': options
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile('rwb') as stream:
+            stream.write(json.dumps(job).encode() + b'\n')
+            stream.flush()
+            reply = stream.readline()
+    if not reply:
+        raise ConnectionError("server closed the connection without replying")
+    return json.loads(reply)
+
+
 def main():
     """Command line interface"""
     parser = argparse.ArgumentParser(
@@ -334,17 +1652,22 @@ Examples:
   python convert_to_pdf.py poster.html -o poster.pdf
   python convert_to_pdf.py poster.html -m playwright
   python convert_to_pdf.py poster.html -m weasyprint -o high_quality.pdf
+  python convert_to_pdf.py posters/*.html -j 4
+  python convert_to_pdf.py --serve --warm &
+  python convert_to_pdf.py --client poster.html
         """
     )
     
     parser.add_argument(
         'html_file',
-        help='HTML file to convert'
+        nargs='*',
+        help='HTML file(s) to convert'
     )
     
     parser.add_argument(
         '-o', '--output',
-        help='Output PDF file (default: same name as HTML with .pdf extension)'
+        help='Output PDF file (default: same name as HTML with .pdf extension; '
+             'single input only)'
     )
     
     parser.add_argument(
@@ -354,14 +1677,181 @@ Examples:
         help='Conversion method (default: auto)'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--settle-ms',
+        type=int,
+        default=0,
+        help='Extra delay after the page is ready, for pages with animations '
+             '(selenium/playwright only, default: 0)'
+    )
     
-    success = html_to_pdf(
-        html_file=args.html_file,
-        output_file=args.output,
-        method=args.method
+    parser.add_argument(
+        '--page-size',
+        choices=[*PAPER_SIZES, 'css'],
+        help='Force a paper size, or use only the CSS @page size '
+             '(selenium/playwright only, default: CSS @page size, else A4)'
     )
     
+    parser.add_argument(
+        '--parallel-pages',
+        action='store_true',
+        help=f'Render pages of long documents in parallel processes '
+             f'(weasyprint only, needs pypdf, {PARALLEL_PAGES_MIN}+ pages; '
+             f'metadata and bookmarks are kept, links between page ranges '
+             f'are lost)'
+    )
+    
+    parser.add_argument(
+        '--optimize-images',
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help='Re-encode embedded images to shrink the PDF '
+             '(weasyprint only, default: off)'
+    )
+    
+    parser.add_argument(
+        '--jpeg-quality',
+        type=int,
+        metavar='N',
+        help='JPEG quality (0-100) for re-encoded images (weasyprint/pdfkit only)'
+    )
+    
+    parser.add_argument(
+        '--preflight-images',
+        action='store_true',
+        help='Downscale local images larger than needed at --target-dpi '
+             'before converting (needs lxml and Pillow)'
+    )
+    
+    parser.add_argument(
+        '--target-dpi',
+        type=int,
+        default=300,
+        help='Print resolution kept by --preflight-images (default: 300)'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Number of files to convert concurrently '
+             '(default: min(number of files, CPU count))'
+    )
+    
+    parser.add_argument(
+        '--ignore-stats',
+        action='store_true',
+        help='In auto mode, use the default backend order and record nothing'
+    )
+    
+    parser.add_argument(
+        '--no-race',
+        action='store_true',
+        help='In auto mode, try backends one at a time instead of racing two '
+             '(racing is only used for a single file)'
+    )
+    
+    parser.add_argument(
+        '--reset-stats',
+        action='store_true',
+        help=f'Forget recorded backend timings ({STATS_PATH})'
+    )
+    
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run a conversion server on a Unix socket instead of converting'
+    )
+    
+    parser.add_argument(
+        '--client',
+        action='store_true',
+        help='Send conversions to a running --serve process'
+    )
+    
+    parser.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET_PATH,
+        help=f'Unix socket for --serve/--client (default: {DEFAULT_SOCKET_PATH})'
+    )
+    
+    parser.add_argument(
+        '--warm',
+        action='store_true',
+        help='With --serve, preload WeasyPrint and launch browsers up front'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.reset_stats:
+        reset_stats()
+        print("🧹 Backend timing stats cleared")
+        if not args.html_file and not args.serve:
+            return
+    
+    if args.serve:
+        sys.exit(0 if serve(args.socket, warm=args.warm, method=args.method) else 1)
+    
+    if not args.html_file:
+        parser.error('at least one HTML file is required')
+    
+    if args.output and len(args.html_file) > 1:
+        parser.error('-o/--output can only be used with a single input file')
+    
+    jobs = args.jobs or min(len(args.html_file), os.cpu_count() or 1)
+    
+    options = {
+        'settle_ms': args.settle_ms,
+        'page_size': args.page_size,
+        'parallel_pages': args.parallel_pages,
+        'optimize_images': args.optimize_images,
+        'jpeg_quality': args.jpeg_quality,
+        'preflight_images': args.preflight_images,
+        'target_dpi': args.target_dpi,
+        'use_stats': not args.ignore_stats,
+        # Concurrent jobs already keep the CPU busy; racing would double it
+        'race': not args.no_race and jobs <= 1
+    }
+    
+    def convert(html_file: str) -> bool:
+        if args.client:
+            try:
+                result = request_conversion(
+                    html_file, args.output, args.method, args.socket, **options
+                )
+            except (OSError, ValueError) as e:
+                print(f"❌ Conversion server at {args.socket} failed: {e}")
+                return False
+            if result['ok']:
+                print(f"✅ {html_file} converted in {result['elapsed_ms']} ms")
+            else:
+                print(f"❌ {html_file}: {result.get('error')}")
+            return result['ok']
+        
+        return html_to_pdf(
+            html_file=html_file,
+            output_file=args.output,
+            method=args.method,
+            **options
+        )
+    
+    if jobs <= 1:
+        results = [convert(html_file) for html_file in args.html_file]
+    else:
+        # Browser backends block on I/O, so threads sharing the browser pool
+        # scale well. Stagger submissions slightly so the first browsers
+        # don't all cold-start at the same instant.
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = []
+            for i, html_file in enumerate(args.html_file):
+                if 0 < i < jobs:
+                    time.sleep(0.05)
+                futures.append(executor.submit(convert, html_file))
+            results = [future.result() for future in futures]
+    
+    success = all(results)
+    if len(results) > 1:
+        print(f"📄 Converted {sum(results)}/{len(results)} files")
+    
     sys.exit(0 if success else 1)
 
 